@@ -6,6 +6,7 @@ import json
 import os
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
@@ -84,6 +85,9 @@ class Davis:
     SCRIBBLES_SUBDIR = 'Scribbles'
     RESOLUTION = '480p'
 
+    # Number of threads used to check the dataset files
+    CHECK_FILES_WORKERS = 8
+
     sets = _SETS
     dataset = _DATASET['sequences']
     years = _DATASET['years']
@@ -161,13 +165,49 @@ class Davis:
             zipdata.extract(info, str(self.davis_root.parent))
         logging.info('Download completed')
 
+    def _check_sequence_files(self, sequence):
+        """ Check if the scribbles and annotations files of a sequence exist.
+
+        # Returns
+            (Boolean, Boolean): Whether all the scribbles files and whether
+                all the annotations files of the sequence are found.
+        """
+        seq_scribbles_path = self.davis_root.joinpath(Davis.SCRIBBLES_SUBDIR,
+                                                      sequence)
+        seq_annotations_path = self.davis_root.joinpath(
+            Davis.ANNOTATIONS_SUBDIR, Davis.RESOLUTION, sequence)
+
+        # Check scribbles files needed to give them as base for the user
+        nb_scribbles = self.dataset[sequence]['num_scribbles']
+        scribbles_found = all(
+            (seq_scribbles_path / '{:03d}.json'.format(i)).exists()
+            for i in range(1, nb_scribbles + 1))
+
+        # Check annotations files required for the evaluation
+        nb_frames = self.dataset[sequence]['num_frames']
+        annotations_found = all(
+            (seq_annotations_path / '{:05}.png'.format(i)).exists()
+            for i in range(nb_frames))
+
+        return scribbles_found, annotations_found
+
+    def _check_sequences_files(self, sequences):
+        # The checks are bound by the file system latency, so the sequences
+        # are checked concurrently.
+        with ThreadPoolExecutor(
+                max_workers=self.CHECK_FILES_WORKERS) as executor:
+            found = list(executor.map(self._check_sequence_files, sequences))
+        scribbles_found = all(s for s, _ in found)
+        annotations_found = all(a for _, a in found)
+        return scribbles_found, annotations_found
+
     def check_files(self, sequences):
         """ Check if the required files are found on DAVIS root.
 
         Check if all the annotations and scribbles files, required to do the
         evaluation are found on `davis_root`.
-        If the scribbles files are not found, it downloads them from the
-        internet.
+        If the scribbles or annotations files are not found, it downloads
+        them from the internet.
 
         # Arguments
             sequences: List. List of sequences you want to check.
@@ -175,27 +215,20 @@ class Davis:
         # Raises
             FileNotFoundError: if any required files is not found.
         """
-        for seq in sequences:
-            seq_scribbles_path = self.davis_root.joinpath(
-                Davis.SCRIBBLES_SUBDIR, seq)
-            seq_annotations_path = self.davis_root.joinpath(
-                Davis.ANNOTATIONS_SUBDIR, Davis.RESOLUTION, seq)
-
-            # Check scribbles files needed to give them as base for the user
-            nb_scribbles = self.dataset[seq]['num_scribbles']
-            for i in range(1, nb_scribbles + 1):
-                scribble_file = seq_scribbles_path / '{:03d}.json'.format(i)
-                if not scribble_file.exists():
-                    self._download_scribbles()
-                    assert scribble_file.exists()
-
-            # Check annotations files required for the evaluation
-            nb_frames = self.dataset[seq]['num_frames']
-            for i in range(nb_frames):
-                annotation_file = seq_annotations_path / '{:05}.png'.format(i)
-                if not annotation_file.exists():
-                    self._download_annotations()
-                    assert annotation_file.exists()
+        scribbles_found, annotations_found = self._check_sequences_files(
+            sequences)
+        if scribbles_found and annotations_found:
+            return True
+
+        # Downloads are done only once and out of the checking threads
+        if not scribbles_found:
+            self._download_scribbles()
+        if not annotations_found:
+            self._download_annotations()
+
+        if not all(self._check_sequences_files(sequences)):
+            raise FileNotFoundError(
+                'Required DAVIS files not found on {}'.format(self.davis_root))
 
         return True
 
@@ -224,34 +257,40 @@ class Davis:
 
         return scribble_data
 
-    def load_annotations(self, sequence, dtype=np.int):
+    def load_annotations(self, sequence, dtype=np.int, frame_indices=None):
         """ Load the annotations of the specified sequence.
 
         # Arguments
             sequence: String. Sequence name.
             dtype: Numpy Data Type. Data type to return the annotations.
                 Default value is `np.int`.
+            frame_indices: List of Integers. Optional indices of the frames to
+                load. Only the files of these frames are read. If `None`, all
+                the frames of the sequence are loaded.
 
         # Returns
             Numpy Array: Array with the annotations of the given sequence. The
-                shape of the array will be `(nb_frames x H x W)` and the value
+                shape of the array will be `(nb_frames x H x W)`, with
+                `nb_frames` being the number of frames loaded, and the value
                 will be the index of the objects, being `0` the background.
         """
         root_path = self.davis_root.joinpath(Davis.ANNOTATIONS_SUBDIR,
                                              Davis.RESOLUTION, sequence)
         num_frames = self.dataset[sequence]['num_frames']
         img_size = self.dataset[sequence]['image_size']
+        if frame_indices is None:
+            frame_indices = range(num_frames)
 
-        annotations = np.empty((num_frames, img_size[1], img_size[0]),
+        annotations = np.empty((len(frame_indices), img_size[1], img_size[0]),
                                dtype=dtype)
 
-        for f in range(num_frames):
+        for i, f in enumerate(frame_indices):
             ann_path = root_path / '{:05d}.png'.format(f)
             ann_path = str(ann_path.resolve())
             mask = Image.open(ann_path)
             mask = np.asarray(mask)
             assert mask.shape == tuple(img_size[::-1])
-            annotations[f] = mask
+            annotations[i] = mask
 
         logging.verbose(
             'Loaded annotations for sequence {} at path {} with shape {}'.
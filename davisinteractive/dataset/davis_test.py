@@ -44,6 +44,26 @@ class TestDavis(unittest.TestCase):
         davis = Davis(os.path.join(tempfile.mkdtemp(), 'DAVIS_2019'))
         davis.check_files(Davis.sets['train'])
 
+    def test_checking_local_files(self):
+        dataset_dir = Path(__file__).parent / 'test_data' / 'DAVIS'
+        davis = Davis(dataset_dir)
+
+        with patch.dict(Davis.dataset['bear'], {
+                'num_frames': 1,
+                'num_scribbles': 1
+        }), patch.object(Davis, '_download_scribbles') as mock_scribbles, \
+                patch.object(Davis, '_download_annotations') as mock_ann:
+            assert davis.check_files(['bear'])
+            assert mock_scribbles.call_count == 0
+            assert mock_ann.call_count == 0
+
+            # Missing files are downloaded only once
+            Davis.dataset['bear']['num_frames'] = 2
+            with pytest.raises(FileNotFoundError):
+                davis.check_files(['bear', 'bear'])
+            assert mock_scribbles.call_count == 0
+            assert mock_ann.call_count == 1
+
     def test_load_scribble(self):
         dataset_dir = Path(__file__).parent / 'test_data' / 'DAVIS'
 
@@ -75,6 +95,11 @@ class TestDavis(unittest.TestCase):
 
         Davis.dataset['bear']['num_frames'] = num_frames
 
+        # Only the requested frames are loaded
+        ann3 = davis.load_annotations('bear', frame_indices=[0, 0])
+        assert ann3.shape == (2, 480, 854)
+        assert np.all(ann3 == ann[[0, 0]])
+
     def test_load_images(self):
         dataset_dir = Path(__file__).parent / 'test_data' / 'DAVIS'
 
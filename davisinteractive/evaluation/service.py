@@ -1,5 +1,7 @@
 from __future__ import absolute_import, division
 
+import collections
+
 import numpy as np
 import pandas as pd
 
@@ -44,6 +46,10 @@ class EvaluationService:
     """
 
     _AVAILABLE_METRICS = ('J', 'F', 'J_AND_F')
+    # Number of sequences whose ground truth masks are kept in memory. The
+    # samples are evaluated one sequence after the other unless shuffled, and
+    # a uint8 DAVIS sequence takes up to ~45 MB.
+    _ANNOTATIONS_CACHE_SIZE = 2
 
     def __init__(self,
                  subset,
@@ -59,6 +65,7 @@ class EvaluationService:
                 Davis.sets.keys()))
 
         self.davis = Davis(davis_root=davis_root)
+        self._annotations_cache = collections.OrderedDict()
 
         robot_parameters = robot_parameters or ROBOT_DEFAULT_PARAMETERS
         self.robot = InteractiveScribblesRobot(**robot_parameters)
@@ -171,7 +178,8 @@ class EvaluationService:
             RuntimeError: When a previous interaction is missing, or the
                 interaction has already been submitted.
             ValueError: When interaction is higher than the maximum number of
-                interactions in the evaluation.
+                interactions in the evaluation, or the predicted masks do not
+                have all the frames of the sequence.
         """
         if self.max_i and interaction > self.max_i:
             raise ValueError(
@@ -185,8 +193,16 @@ class EvaluationService:
                 'Sequence: {} and scribble index: {} invalid'.format(
                     sequence, scribble_idx))
 
+        # All the frames must be predicted. Checked before loading the
+        # ground truth so invalid masks do not cost decoding the annotations.
+        nb_frames = Davis.dataset[sequence]['num_frames']
+        if len(pred_masks) != nb_frames:
+            raise ValueError(
+                'Predicted masks have {} frames but sequence {} has {}'.format(
+                    len(pred_masks), sequence, nb_frames))
+
         # Load ground truth masks and compute jaccard metric
-        gt_masks = self.davis.load_annotations(sequence)
+        gt_masks = self._load_annotations(sequence)
         nb_objects = Davis.dataset[sequence]['num_objects']
 
         # only compute the metrics actually used
@@ -209,18 +225,14 @@ class EvaluationService:
 
         nb_frames, _ = jaccard.shape
 
-        frames_idx = np.arange(nb_frames)
-        objects_idx = np.arange(nb_objects) + 1
-
-        objects_idx, frames_idx = np.meshgrid(objects_idx, frames_idx)
+        # Frame and object index of every entry of the flattened metrics
+        frames_idx = np.repeat(np.arange(nb_frames), nb_objects)
+        objects_idx = np.tile(np.arange(nb_objects) + 1, nb_frames)
 
         # Save the results on storage
         self.storage.store_interactions_results(
             user_key, session_key, sequence, scribble_idx, interaction, timing,
-            objects_idx.ravel().tolist(),
-            frames_idx.ravel().tolist(),
-            jaccard.ravel().tolist(),
-            contour.ravel().tolist())
+            objects_idx, frames_idx, jaccard.ravel(), contour.ravel())
 
         if self.metric_to_optimize == 'J':
             metric = jaccard.mean(axis=1)
@@ -270,6 +282,26 @@ class EvaluationService:
 
         return next_scribble
 
+    def _load_annotations(self, sequence):
+        """ Load the ground truth masks of a sequence.
+
+        The masks of the last used sequences are kept in a LRU cache, as every
+        sample is evaluated for several interactions in a row. They are kept
+        as `uint8`, the type of the annotations files, and the returned array
+        is read only.
+        """
+        cache = self._annotations_cache
+        if sequence in cache:
+            cache.move_to_end(sequence)
+            return cache[sequence]
+
+        gt_masks = self.davis.load_annotations(sequence, dtype=np.uint8)
+        gt_masks.flags.writeable = False
+        cache[sequence] = gt_masks
+        if len(cache) > self._ANNOTATIONS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return gt_masks
+
     def get_report(self, **kwargs):
         """ Get report for a session.
 
@@ -297,8 +329,8 @@ class EvaluationService:
                 ['interaction', 'sequence', 'scribble_idx', 'object_id'])
         else:
             df = df.groupby(
-                ['interaction', 'sequence', 'scribble_idx',
-                 'object_id']).mean()
+                ['interaction', 'sequence', 'scribble_idx', 'object_id'],
+                observed=True).mean()
         if 'frame' in df:
             df = df.drop(columns='frame')
         if 'session_id' in df:
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from davisinteractive.common import Path, patch
@@ -81,3 +82,32 @@ class TestEvaluationService(unittest.TestCase):
                                          None)
         with self.assertRaises(ValueError):
             service.post_predicted_masks('bear', 4, None, 0, 1, None, None)
+        with self.assertRaises(ValueError):
+            service.post_predicted_masks('bear', 1, np.zeros((1, 480, 854)), 0,
+                                         1, None, None)
+
+    @patch.object(Davis, 'check_files', return_value=True)
+    def test_annotations_cache(self, _):
+        service = EvaluationService('train', davis_root='/tmp/DAVIS')
+        cache_size = service._ANNOTATIONS_CACHE_SIZE
+        sequences = service.sequences[:cache_size + 1]
+
+        with patch.object(
+                Davis,
+                'load_annotations',
+                side_effect=lambda s, dtype: np.zeros((2, 4, 4), dtype=dtype)
+        ) as mock_load:
+            for s in sequences[:cache_size]:
+                gt_masks = service._load_annotations(s)
+                assert gt_masks.dtype == np.uint8
+                assert not gt_masks.flags.writeable
+            service._load_annotations(sequences[0])
+            assert mock_load.call_count == cache_size
+
+            # The least recently used sequence is evicted
+            service._load_annotations(sequences[cache_size])
+            assert mock_load.call_count == cache_size + 1
+            service._load_annotations(sequences[0])
+            assert mock_load.call_count == cache_size + 1
+            service._load_annotations(sequences[1])
+            assert mock_load.call_count == cache_size + 2
@@ -33,8 +33,10 @@ def batched_jaccard(y_true, y_pred, average_over_objects=True, nb_objects=None):
             `average_over_objects=False` returns an array of shape (B x nObj)
             with nObj being the number of objects on `y_true`.
     """
-    y_true = np.asarray(y_true, dtype=np.int)
-    y_pred = np.asarray(y_pred, dtype=np.int)
+    # Integer masks are used as they are, avoiding a copy of the whole
+    # sequence only to widen their type.
+    y_true = _as_integer_array(y_true)
+    y_pred = _as_integer_array(y_pred)
     if y_true.ndim != 3:
         raise ValueError('y_true array must have 3 dimensions.')
     if y_pred.ndim != 3:
@@ -46,31 +48,38 @@ def batched_jaccard(y_true, y_pred, average_over_objects=True, nb_objects=None):
         objects_ids = np.unique(y_true[(y_true < 255) & (y_true > 0)])
         nb_objects = len(objects_ids)
     else:
-        objects_ids = [i + 1 for i in range(nb_objects)]
-        objects_ids = np.asarray(objects_ids, dtype=np.int)
+        objects_ids = np.arange(1, nb_objects + 1)
     if nb_objects == 0:
         raise ValueError('Number of objects in y_true should be higher than 0.')
     nb_frames = len(y_true)
 
-    jaccard = np.empty((nb_frames, nb_objects), dtype=np.float)
+    jaccard = np.empty((nb_frames, nb_objects), dtype=np.float64)
 
+    # Every iteration sweeps all the frames at once. Looping over the objects
+    # keeps the peak memory to a couple of boolean masks of the sequence size.
     for i, obj_id in enumerate(objects_ids):
         mask_true, mask_pred = y_true == obj_id, y_pred == obj_id
 
-        union = (mask_true | mask_pred).sum(axis=(1, 2))
-        intersection = (mask_true & mask_pred).sum(axis=(1, 2))
+        union = np.logical_or(mask_true, mask_pred).sum(axis=(1, 2))
+        intersection = np.logical_and(mask_true, mask_pred).sum(axis=(1, 2))
 
-        for j in range(nb_frames):
-            if np.isclose(union[j], 0):
-                jaccard[j, i] = 1.
-            else:
-                jaccard[j, i] = intersection[j] / union[j]
+        # Objects not present in the frame neither in the prediction score 1
+        np.divide(intersection, union, out=jaccard[:, i], where=union > 0)
+        jaccard[union == 0, i] = 1.
 
     if average_over_objects:
         jaccard = jaccard.mean(axis=1)
     return jaccard
 
 
+def _as_integer_array(y):
+    """ Return `y` as an integer array, only casting it if needed. """
+    y = np.asarray(y)
+    if not np.issubdtype(y.dtype, np.integer):
+        y = y.astype(np.int64)
+    return y
+
+
 def _seg2bmap(seg, width=None, height=None):
     """
     From a segmentation, compute a binary boundary map with 1 pixel wide
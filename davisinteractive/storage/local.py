@@ -1,5 +1,7 @@
 from __future__ import absolute_import, division
 
+import collections
+
 import numpy as np
 import pandas as pd
 
@@ -14,11 +16,30 @@ class LocalStorage(AbstractStorage):
     This class encapsulates the storage of the results into a pandas DataFrame.
     """
 
+    # Types of the report columns. Identifiers are downcasted and the names
+    # stored as categories; metrics and timing keep the full precision.
+    COLUMNS_DTYPES = {
+        'session_id': 'category',
+        'sequence': 'category',
+        'scribble_idx': 'int8',
+        'interaction': 'int16',
+        'object_id': 'int16',
+        'frame': 'int16',
+        'jaccard': 'float64',
+        'contour': 'float64',
+        'j_and_f': 'float64',
+        'timing': 'float64'
+    }
+
     def __init__(self):
-        self.report = pd.DataFrame(columns=self.COLUMNS)
-        logging.verbose('Report DataFrame created')
-        self.annotated_frames = pd.DataFrame(
-            columns=['sequence', 'scribble_idx', 'frame', 'override'])
+        # Results are buffered as one block of columns per interaction and
+        # the DataFrame is only built when the report is requested, avoiding
+        # a full copy of all the previous entries on every stored interaction.
+        self._report_blocks = []
+        self._accepted = set()
+        logging.verbose('Report buffer created')
+        self._annotated_frames_rows = []
+        self._annotated_frames_index = collections.defaultdict(set)
         logging.verbose('Annotated frames created')
 
     def store_interactions_results(self, user_id, session_id, sequence,
@@ -34,23 +55,23 @@ class LocalStorage(AbstractStorage):
             scribble_idx: Integer. Scribble index of the sample.
             interaction: Integer. Interaction number.
             timing: Float. Timing in seconds that lasted the interaction.
-            objects_idx: List of Integers. List of the objects identifiers that
-                match with the jaccard metric.
-            frames: List of Integers: List of frame index matching with the
-                jaccard metric.
-            jaccard: List of Floats: List of jaccard metric.
-            contour: List of Floats: List of contour metric.
+            objects_idx: List or Numpy Array of Integers. List of the objects
+                identifiers that match with the jaccard metric.
+            frames: List or Numpy Array of Integers: List of frame index
+                matching with the jaccard metric.
+            jaccard: List or Numpy Array of Floats: List of jaccard metric.
+            contour: List or Numpy Array of Floats: List of contour metric.
         """
         # Check the data.
-        objects_idx = list(objects_idx)
-        frames = list(frames)
-        jaccard = list(jaccard)
-        contour = list(contour)
+        objects_idx = np.asarray(objects_idx, dtype=np.int64).ravel()
+        frames = np.asarray(frames, dtype=np.int64).ravel()
+        jaccard = np.asarray(jaccard, dtype=np.float64).ravel()
+        contour = np.asarray(contour, dtype=np.float64).ravel()
         assert len(jaccard) == len(contour)
-        j_and_f = [.5 * j + .5 * f for j, f in zip(jaccard, contour)]
-        if (min(jaccard) < 0.) or (max(jaccard) > 1.):
+        j_and_f = .5 * jaccard + .5 * contour
+        if (jaccard.min() < 0.) or (jaccard.max() > 1.):
             raise ValueError('Jaccard values must be between 0 and 1')
-        if (min(contour) < 0.) or (max(contour) > 1.):
+        if (contour.min() < 0.) or (contour.max() > 1.):
             raise ValueError('Jaccard values must be between 0 and 1')
 
         nb = len(jaccard)
@@ -59,37 +80,72 @@ class LocalStorage(AbstractStorage):
                              'have the same length')
 
         # Check previous entries
-        if self.report.loc[(self.report.sequence == sequence) &
-                           (self.report.scribble_idx == scribble_idx) &
-                           (self.report.interaction == interaction)].size > 0:
+        key = (sequence, scribble_idx, interaction)
+        if key in self._accepted:
             raise RuntimeError(('For {} and scribble {} already exist a '
                                 'result for interaction {}').format(
                                     sequence, scribble_idx, interaction))
-        if interaction > 1 and self.report.loc[
-            (self.report.sequence == sequence) &
-            (self.report.scribble_idx == scribble_idx) &
-            (self.report.interaction == interaction - 1)].size == 0:
+        if interaction > 1 and (sequence, scribble_idx,
+                                interaction - 1) not in self._accepted:
             raise RuntimeError(('For {} and scribble {} does not exist a '
                                 'result for previous interaction {}').format(
                                     sequence, scribble_idx, interaction - 1))
 
-        sample = {}
-        sample['session_id'] = [session_id] * nb
-        sample['sequence'] = [sequence] * nb
-        sample['scribble_idx'] = [scribble_idx] * nb
-        sample['interaction'] = [interaction] * nb
-        sample['timing'] = [timing] * nb
-        sample['object_id'] = objects_idx
-        sample['frame'] = frames
-        sample['jaccard'] = jaccard
-        sample['contour'] = contour
-        sample['j_and_f'] = j_and_f
-        sample = pd.DataFrame(data=sample, columns=self.COLUMNS)
-        self.report = pd.concat([self.report, sample], ignore_index=True)
+        self._report_blocks.append({
+            'session_id': session_id,
+            'sequence': sequence,
+            'scribble_idx': scribble_idx,
+            'interaction': interaction,
+            'object_id': objects_idx,
+            'frame': frames,
+            'jaccard': jaccard,
+            'contour': contour,
+            'j_and_f': j_and_f,
+            'timing': timing
+        })
+        self._accepted.add(key)
         logging.info('Successfully stored sample interaction entry')
 
         return True
 
+    @property
+    def report(self):
+        """ Pandas DataFrame. All the stored interactions results. """
+        return self._build_report(self._report_blocks)
+
+    def _build_report(self, blocks):
+        """ Build the report DataFrame from the given blocks of results.
+
+        This is the only place where the DataFrame is constructed and its
+        columns are laid out in the `COLUMNS` order.
+        """
+        if not blocks:
+            return pd.DataFrame(columns=self.COLUMNS).astype(
+                self.COLUMNS_DTYPES)
+
+        # Scalar values of every block are repeated for all its entries.
+        # Every column is built directly with its final type.
+        sizes = [len(b['jaccard']) for b in blocks]
+        data = {}
+        for c in self.COLUMNS:
+            values = [b[c] for b in blocks]
+            if np.ndim(values[0]) == 0:
+                values = np.repeat(values, sizes)
+            else:
+                values = np.concatenate(values)
+            if self.COLUMNS_DTYPES[c] == 'category':
+                data[c] = pd.Categorical(values)
+            else:
+                data[c] = values.astype(self.COLUMNS_DTYPES[c], copy=False)
+        return pd.DataFrame(data=data, columns=self.COLUMNS)
+
+    @property
+    def annotated_frames(self):
+        """ Pandas DataFrame. All the stored annotated frames. """
+        return pd.DataFrame(
+            self._annotated_frames_rows,
+            columns=['sequence', 'scribble_idx', 'frame', 'override'])
+
     def get_report(self, session_id=None, **kwargs):
         """ Return current report.
 
@@ -99,9 +155,11 @@ class LocalStorage(AbstractStorage):
         # Returns
             Pandas DataFrame. Report in the form of the DataFrame.
         """
-        df = self.report
-        df = df.loc[df['session_id'] == session_id].reset_index(drop=True)
-        return df
+        # Only the results of the session are gathered into the DataFrame
+        blocks = [
+            b for b in self._report_blocks if b['session_id'] == session_id
+        ]
+        return self._build_report(blocks)
 
     def get_annotated_frames(self, session_id, sequence, scribble_idx):
         """Get the previous annotated frames for the given iteration.
@@ -117,11 +175,9 @@ class LocalStorage(AbstractStorage):
         """
         del session_id
 
-        df = self.annotated_frames.copy()
-        prev_frames = df.loc[
-            (df['sequence'] == sequence) &
-            (df['scribble_idx'] == scribble_idx)]['frame'].values
-        prev_frames = np.unique(prev_frames)
+        prev_frames = self._annotated_frames_index.get((sequence,
+                                                        scribble_idx), ())
+        prev_frames = sorted(prev_frames)
 
         if len(prev_frames) == Davis.dataset[sequence]['num_frames']:
             return tuple()
@@ -147,8 +203,7 @@ class LocalStorage(AbstractStorage):
         """
         del session_id
 
-        new_row = pd.DataFrame(
-            [[sequence, scribble_idx, annotated_frame, override]],
-            columns=['sequence', 'scribble_idx', 'frame', 'override'])
-        self.annotated_frames = pd.concat([self.annotated_frames, new_row],
-                                          ignore_index=True)
+        self._annotated_frames_rows.append(
+            [sequence, scribble_idx, annotated_frame, override])
+        self._annotated_frames_index[(sequence,
+                                      scribble_idx)].add(annotated_frame)
@@ -12,6 +12,7 @@ class TestLocalStorage(unittest.TestCase):
 
         for c in storage.COLUMNS:
             assert c in storage.report
+            assert storage.report[c].dtype == storage.COLUMNS_DTYPES[c]
 
     def test_store_operation(self):
         user_id = 'empty'
@@ -59,6 +60,24 @@ class TestLocalStorage(unittest.TestCase):
             user_id, session_id, sequence, scribble_idx, interaction + 1,
             timing, objects_idx, frames, jaccard, contour)
 
+    def test_report(self):
+        storage = LocalStorage()
+        for interaction in (1, 2):
+            storage.store_interactions_results('empty', '12345', 'test', 1,
+                                               interaction, 10.34, [1, 2],
+                                               [0, 0], [.2, .4], [.8, .6])
+
+        report = storage.get_report(session_id='12345')
+        assert list(report.columns) == storage.COLUMNS
+        assert len(report) == 4
+        assert report['interaction'].tolist() == [1, 1, 2, 2]
+        assert report['object_id'].tolist() == [1, 2, 1, 2]
+        assert np.allclose(report['j_and_f'], [.5, .5, .5, .5])
+        for c, dtype in storage.COLUMNS_DTYPES.items():
+            assert report[c].dtype == dtype
+        assert report['sequence'].tolist() == ['test'] * 4
+        assert len(storage.get_report(session_id='other')) == 0
+
     def test_annotated_frames(self):
         session_id = 'unused'
         sequence = 'bmx-trees'
@@ -29,11 +29,10 @@ def combine_masks(masks, th=0.5, method='max_per_pixel'):
         for obj_id in range(n_objects):
             res_mat[:, :, obj_id] = masks[obj_id][fr_id]
         marker = np.argmax(res_mat, axis=2)
-        out_mask = np.zeros((masks[0][fr_id].shape[0],
-                            masks[0][fr_id].shape[1]))
+        # Write straight into the (already zeroed) frame of the output
+        out_mask = output_masks[fr_id]
         for obj_id in range(n_objects):
             tmp_mask = np.logical_and(marker == obj_id,
                                       masks[obj_id][fr_id] > th)
             out_mask[tmp_mask] = obj_id + 1
-        output_masks[fr_id, :, :] = out_mask
     return output_masks
@@ -1,8 +1,15 @@
 from __future__ import absolute_import, division
 
+import functools
+
 import numpy as np
 from scipy.special import comb
 
+try:
+    from numba import njit
+except ImportError:  # Numba is an optional dependency
+    njit = None
+
 
 def bezier_curve(points, nb_points=1000):
     """ Given a list of points compute a bezier curve from it.
@@ -22,7 +29,7 @@ def bezier_curve(points, nb_points=1000):
     """
     nb_points = min(nb_points, 1000)
 
-    points = np.asarray(points, dtype=np.float)
+    points = np.asarray(points, dtype=np.float64)
     if points.ndim != 2 or points.shape[1] != 2:
         raise ValueError(
             '`points` should be two dimensional and have shape: (N, 2)')
@@ -32,6 +39,22 @@ def bezier_curve(points, nb_points=1000):
         # We are downsampling points
         return points
 
+    bezier_curve_points = _bernstein_basis(nb_points, n_points).dot(points)
+
+    return bezier_curve_points
+
+
+@functools.lru_cache(maxsize=16)
+def _bernstein_basis(nb_points, n_points):
+    """ Bernstein polynomials basis of degree `n_points - 1` sampled at
+    `nb_points` values of t between 0 and 1.
+
+    The basis only depends on the sizes, so it is cached and `bezier_curve`
+    is reduced to a single matrix multiplication. The returned array has
+    shape (nb_points, n_points) and is read only. Every entry can take up to
+    8 MB and the robot paths have many different lengths, so only a few
+    bases are kept.
+    """
     t = np.linspace(0., 1., nb_points).reshape(1, -1)
 
     # Compute the Bernstein polynomial of n, i as a function of t
@@ -39,9 +62,9 @@ def bezier_curve(points, nb_points=1000):
     n = n_points - 1
     polynomial_array = comb(n, i) * (t**(n - i)) * (1 - t)**i
 
-    bezier_curve_points = polynomial_array.T.dot(points)
-
-    return bezier_curve_points
+    basis = np.ascontiguousarray(polynomial_array.T)
+    basis.flags.writeable = False
+    return basis
 
 
 def bresenham(points):
@@ -58,49 +81,151 @@ def bresenham(points):
         ndarray: Array of points after having applied the bresenham algorithm.
     """
 
-    points = np.asarray(points, dtype=np.int)
+    points = np.asarray(points, dtype=np.int64)
 
-    def line(x0, y0, x1, y1):
-        """ Bresenham line algorithm.
-        """
-        d_x = x1 - x0
-        d_y = y1 - y0
+    nb_points = len(points)
+    if nb_points < 2:
+        return points
 
-        x_sign = 1 if d_x > 0 else -1
-        y_sign = 1 if d_y > 0 else -1
+    # All the segments are rasterized at once. For a segment with steps
+    # `d` along its major axis and `m` along the minor one, the minor offset
+    # at step `k` of the integer algorithm is `floor((2 * m * k + d) / 2d)`.
+    deltas = np.diff(points, axis=0)
+    signs = np.where(deltas > 0, 1, -1)
+    abs_deltas = np.abs(deltas)
+    x_major = abs_deltas[:, 0] > abs_deltas[:, 1]
+    major = np.where(x_major, abs_deltas[:, 0], abs_deltas[:, 1])
+    minor = np.where(x_major, abs_deltas[:, 1], abs_deltas[:, 0])
+
+    lengths = major + 1
+    segment = np.repeat(np.arange(nb_points - 1), lengths)
+    k = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths,
+                                             lengths)
+    d = np.maximum(major, 1)[segment]
+    y = (2 * minor[segment] * k + d) // (2 * d)
+
+    # Steps along (major, minor) axis mapped back into (x, y) coordinates
+    x_major = x_major[segment]
+    steps = np.where(x_major[:, None], np.stack([k, y], axis=1),
+                     np.stack([y, k], axis=1))
+    new_points = points[:-1][segment] + steps * signs[segment]
 
-        d_x = np.abs(d_x)
-        d_y = np.abs(d_y)
+    return new_points
 
-        if d_x > d_y:
-            xx, xy, yx, yy = x_sign, 0, 0, y_sign
-        else:
-            d_x, d_y = d_y, d_x
-            xx, xy, yx, yy = 0, y_sign, x_sign, 0
 
-        D = 2 * d_y - d_x
-        y = 0
+def _rasterize_paths_loop(mask, points, paths_offsets, objects_ids,
+                          draw_lines):
+    """ Integer Bresenham rasterization of all the paths into `mask`.
 
-        line = np.empty((d_x + 1, 2), dtype=points.dtype)
-        for x in range(d_x + 1):
-            line[x] = [x0 + x * xx + y * yx, y0 + x * xy + y * yy]
-            if D >= 0:
-                y += 1
-                D -= 2 * d_x
-            D += 2 * d_y
+    This is the same algorithm as `bresenham` but writing every pixel of the
+    lines directly into the mask. It is written with plain loops for being
+    compiled with Numba.
+    """
+    for p in range(len(objects_ids)):
+        obj_id = objects_ids[p]
+        start, end = paths_offsets[p], paths_offsets[p + 1]
+
+        if not draw_lines or end - start < 2:
+            for i in range(start, end):
+                mask[points[i, 1], points[i, 0]] = obj_id
+            continue
+
+        for i in range(start, end - 1):
+            x0, y0 = points[i, 0], points[i, 1]
+            d_x = points[i + 1, 0] - x0
+            d_y = points[i + 1, 1] - y0
+
+            x_sign = 1 if d_x > 0 else -1
+            y_sign = 1 if d_y > 0 else -1
+
+            d_x = abs(d_x)
+            d_y = abs(d_y)
+
+            if d_x > d_y:
+                xx, xy, yx, yy = x_sign, 0, 0, y_sign
+            else:
+                d_x, d_y = d_y, d_x
+                xx, xy, yx, yy = 0, y_sign, x_sign, 0
+
+            D = 2 * d_y - d_x
+            y = 0
+
+            for x in range(d_x + 1):
+                mask[y0 + x * xy + y * yy, x0 + x * xx + y * yx] = obj_id
+                if D >= 0:
+                    y += 1
+                    D -= 2 * d_x
+                D += 2 * d_y
+
+
+def _rasterize_paths_numpy(mask, points, paths_offsets, objects_ids,
+                           draw_lines):
+    """ Rasterization of all the paths into `mask` using `bresenham`.
+    """
+    for p, obj_id in enumerate(objects_ids):
+        path = points[paths_offsets[p]:paths_offsets[p + 1]]
+        if draw_lines:
+            path = bresenham(path)
+        mask[path[:, 1], path[:, 0]] = obj_id
 
-        return line
 
-    nb_points = len(points)
-    if nb_points < 2:
-        return points
+if njit is not None:
+    _rasterize_paths = njit(cache=True)(_rasterize_paths_loop)
+else:
+    _rasterize_paths = _rasterize_paths_numpy
 
-    new_points = []
 
-    for i in range(nb_points - 1):
-        p = points[i:i + 2].ravel().tolist()
-        new_points.append(line(*p))
+def rasterize_paths(mask, points, paths_offsets, objects_ids, draw_lines=True):
+    """ Draw a set of paths into a mask.
 
-    new_points = np.concatenate(new_points, axis=0)
+    The paths are given concatenated into a single array of points and every
+    pixel covered by a path is set, inplace, to the object id of the path. If
+    Numba is installed the rasterization is done by a compiled function,
+    otherwise it falls back to `bresenham`.
 
-    return new_points
+    # Arguments
+        mask: ndarray. Array of shape (H, W) where the paths are drawn.
+        points: ndarray. Array of integer points with shape (N, 2) with N
+            being the total number of points of all the paths and the second
+            dimension representing the (x, y) coordinates. Preferably of type
+            `int32`, otherwise it is cast. As with NumPy indexing, negative
+            coordinates are counted from the end of the mask.
+        paths_offsets: ndarray. Array of shape (P + 1,) with P being the number
+            of paths. The points of the path `i` are
+            `points[paths_offsets[i]:paths_offsets[i + 1]]`.
+        objects_ids: ndarray. Array of shape (P,) with the object id of every
+            path.
+        draw_lines: Boolean. Whether to draw the lines between consecutive
+            points of a path with the Bresenham algorithm or only the points.
+
+    # Raises
+        ValueError: if the points are out of the mask bounds or the offsets
+            are invalid.
+    """
+    # 32 bits contiguous coordinates halve the memory traffic of the points,
+    # and int32 inputs do not need a copy.
+    points = np.ascontiguousarray(points, dtype=np.int32)
+    paths_offsets = np.asarray(paths_offsets, dtype=np.int64)
+    objects_ids = np.asarray(objects_ids, dtype=mask.dtype)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(
+            '`points` should be two dimensional and have shape: (N, 2)')
+    if len(paths_offsets) != len(objects_ids) + 1:
+        raise ValueError('`paths_offsets` must have one element more than '
+                         '`objects_ids`')
+
+    # The compiled kernel does not check the bounds, so an invalid index
+    # would write out of the mask memory. The lines never leave the box of
+    # their end points, so checking the points is enough.
+    if len(paths_offsets) > 0 and (paths_offsets[0] < 0 or np.any(
+            np.diff(paths_offsets) < 0) or paths_offsets[-1] > len(points)):
+        raise ValueError('`paths_offsets` must be increasing and within the '
+                         'number of points')
+    if len(points) > 0:
+        h, w = mask.shape
+        x, y = points[:, 0], points[:, 1]
+        if x.min() < -w or x.max() >= w or y.min() < -h or y.max() >= h:
+            raise ValueError('`points` out of the mask bounds {}'.format(
+                mask.shape))
+
+    _rasterize_paths(mask, points, paths_offsets, objects_ids, draw_lines)
@@ -0,0 +1,126 @@
+from __future__ import absolute_import, division
+
+import unittest
+
+import numpy as np
+import pytest
+
+from ..common import patch
+from . import operations
+from .operations import bezier_curve, bresenham, rasterize_paths
+
+
+class TestRasterizePaths(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.paths = [
+            rng.randint(0, 100, size=(n, 2)) for n in (1, 2, 5, 20)
+        ]
+        self.objects_ids = [1, 2, 3, 1]
+        self.points = np.concatenate(self.paths)
+        self.offsets = np.cumsum([0] + [len(p) for p in self.paths])
+
+    def _expected(self, draw_lines):
+        mask = np.zeros((100, 100), dtype=np.int64)
+        for path, obj_id in zip(self.paths, self.objects_ids):
+            if draw_lines:
+                path = bresenham(path)
+            mask[path[:, 1], path[:, 0]] = obj_id
+        return mask
+
+    def test_rasterize_paths(self):
+        for draw_lines in (True, False):
+            mask = np.zeros((100, 100), dtype=np.int64)
+            rasterize_paths(
+                mask,
+                self.points,
+                self.offsets,
+                self.objects_ids,
+                draw_lines=draw_lines)
+            assert np.all(mask == self._expected(draw_lines))
+
+    def test_rasterize_paths_numpy(self):
+        for draw_lines in (True, False):
+            mask = np.zeros((100, 100), dtype=np.int64)
+            operations._rasterize_paths_numpy(mask, self.points, self.offsets,
+                                              np.asarray(self.objects_ids),
+                                              draw_lines)
+            assert np.all(mask == self._expected(draw_lines))
+
+    def test_out_of_bounds(self):
+        rasterizers = [operations._rasterize_paths_numpy]
+        if operations.njit is not None:
+            rasterizers.append(operations._rasterize_paths)
+
+        for rasterizer in rasterizers:
+            with patch.object(operations, '_rasterize_paths', rasterizer):
+                for draw_lines in (True, False):
+                    for points in ([[0, 0], [0, 12]], [[0, 0], [10, 0]],
+                                   [[0, 0], [-11, 0]]):
+                        mask = np.zeros((10, 10), dtype=np.int16)
+                        with pytest.raises(ValueError):
+                            rasterize_paths(
+                                mask,
+                                points, [0, 2], [1],
+                                draw_lines=draw_lines)
+                        assert np.all(mask == 0)
+
+                    with pytest.raises(ValueError):
+                        rasterize_paths(mask, [[0, 0], [1, 1]], [0, 3], [1])
+
+                # Negative coordinates index from the end as in NumPy
+                mask = np.zeros((10, 10), dtype=np.int16)
+                rasterize_paths(mask, [[-1, -1]], [0, 1], [1])
+                assert mask[9, 9] == 1 and mask.sum() == 1
+
+    def test_invalid_input(self):
+        mask = np.zeros((100, 100), dtype=np.int64)
+        with pytest.raises(ValueError):
+            rasterize_paths(mask, [0, 1], [0, 1], [1])
+        with pytest.raises(ValueError):
+            rasterize_paths(mask, self.points, self.offsets, [1])
+
+
+class TestBresenham(unittest.TestCase):
+
+    def test_bresenham(self):
+        line = bresenham([[0, 0], [3, 1]])
+        assert np.all(line == [[0, 0], [1, 0], [2, 1], [3, 1]])
+
+        line = bresenham([[3, 1], [0, 0]])
+        assert np.all(line == [[3, 1], [2, 1], [1, 0], [0, 0]])
+
+        line = bresenham([[0, 0], [0, 2], [1, 2]])
+        assert np.all(line == [[0, 0], [0, 1], [0, 2], [0, 2], [1, 2]])
+
+    def test_bresenham_single_point(self):
+        assert np.all(bresenham([[1, 2]]) == [[1, 2]])
+        assert np.all(bresenham([[1, 2], [1, 2]]) == [[1, 2]])
+
+
+class TestBezierCurve(unittest.TestCase):
+
+    def test_bezier_curve(self):
+        points = np.asarray([[0., 0.], [.5, 1.], [1., 0.]])
+        curve = bezier_curve(points, nb_points=5)
+        assert curve.shape == (5, 2)
+        assert np.allclose(curve[0], points[-1])
+        assert np.allclose(curve[-1], points[0])
+        assert np.allclose(curve[2], [.5, .5])
+
+        # Same sizes reuse the cached basis without modifying it
+        curve_2 = bezier_curve(points + 1., nb_points=5)
+        assert np.allclose(curve_2, curve + 1.)
+
+    def test_bernstein_basis_cache_bounded(self):
+        maxsize = operations._bernstein_basis.cache_info().maxsize
+        assert maxsize is not None and maxsize <= 16
+
+        for n_points in range(2, maxsize + 10):
+            bezier_curve(np.random.rand(n_points, 2), nb_points=100)
+        assert operations._bernstein_basis.cache_info().currsize <= maxsize
+
+    def test_bezier_curve_downsampling(self):
+        points = np.random.rand(20, 2)
+        assert np.all(bezier_curve(points, nb_points=10) == points)
@@ -2,8 +2,7 @@ from __future__ import absolute_import, division
 
 import numpy as np
 
-from .operations import bezier_curve
-from .operations import bresenham as bresenham_function
+from .operations import bezier_curve, rasterize_paths
 
 
 def scribbles2mask(scribbles,
@@ -11,7 +10,8 @@ def scribbles2mask(scribbles,
                    bezier_curve_sampling=False,
                    nb_points=1000,
                    bresenham=True,
-                   default_value=-1):
+                   default_value=-1,
+                   only_annotated_frame=False):
     """ Convert the scribbles data into a mask.
 
     # Arguments
@@ -25,11 +25,14 @@ def scribbles2mask(scribbles,
             scribbles lines.
         default_value: Integer. Default value for the pixels which do not belong
             to any scribble.
+        only_annotated_frame: Boolean. Whether to only compute the mask of the
+            annotated frame. It is given by the `annotated_frame` field of the
+            scribbles or, if missing, by the only frame with scribbles.
 
     # Returns
-        ndarray: Array with the mask of the scribbles with the index of the
-            object ids. The shape of the returned array is (B x H x W) by
-            default or (H x W) if `only_annotated_frame==True`.
+        ndarray: Array of type `int16` with the mask of the scribbles with the
+            index of the object ids. The shape of the returned array is
+            (B x H x W) by default or (H x W) if `only_annotated_frame==True`.
     """
     if len(output_resolution) != 2:
         raise ValueError(
@@ -38,32 +41,64 @@ def scribbles2mask(scribbles,
         if r < 1:
             raise ValueError(
                 'Invalid output resolution: {}'.format(output_resolution))
-
-    nb_frames = len(scribbles['scribbles'])
+    output_resolution = tuple(output_resolution)
+
+    frames_scribbles = scribbles['scribbles']
+    if only_annotated_frame:
+        # Only the annotated frame is allocated and rasterized
+        frames = [_annotated_frame(scribbles)]
+    else:
+        frames = range(len(frames_scribbles))
     masks = np.full(
-        (nb_frames,) + output_resolution, default_value, dtype=np.int)
+        (len(frames),) + output_resolution, default_value, dtype=np.int16)
+
+    size_array = np.asarray(output_resolution[::-1], dtype=np.float64) - 1
 
-    size_array = np.asarray(output_resolution[::-1], dtype=np.float) - 1
+    for i, f in enumerate(frames):
+        sp = frames_scribbles[f]
+        if not sp:
+            continue
 
-    for f in range(nb_frames):
-        sp = scribbles['scribbles'][f]
+        paths, objects_ids = [], []
         for p in sp:
-            path = p['path']
-            obj_id = p['object_id']
-            path = np.asarray(path, dtype=np.float)
-            if bezier_curve_sampling:
-                path = bezier_curve(path, nb_points=nb_points)
-            path *= size_array
-            path = path.astype(np.int)
+            paths.append(p['path'])
+            objects_ids.append(p['object_id'])
+
+        # All the paths of the frame are scaled and rasterized at once
+        if bezier_curve_sampling:
+            paths = [bezier_curve(p, nb_points=nb_points) for p in paths]
+            points = np.concatenate(paths)
+        else:
+            points = np.asarray([point for p in paths for point in p],
+                                dtype=np.float64).reshape(-1, 2)
+        paths_offsets = np.cumsum([0] + [len(p) for p in paths])
+        points *= size_array
+        points = points.astype(np.int32)
+
+        rasterize_paths(
+            masks[i],
+            points,
+            paths_offsets,
+            objects_ids,
+            draw_lines=bresenham)
+
+    if only_annotated_frame:
+        return masks[0]
+    return masks
 
-            if bresenham:
-                path = bresenham_function(path)
-            m = masks[f]
 
-            m[path[:, 1], path[:, 0]] = obj_id
-            masks[f] = m
+def _annotated_frame(scribbles_data):
+    """ Get the annotated frame of the given scribbles.
+    """
+    if scribbles_data.get('annotated_frame') is not None:
+        return scribbles_data['annotated_frame']
 
-    return masks
+    frames_list = annotated_frames(scribbles_data)
+    if len(frames_list) != 1:
+        raise ValueError('The annotated frame can not be inferred from '
+                         'scribbles with {} annotated frames'.format(
+                             len(frames_list)))
+    return frames_list[0]
 
 
 def scribbles2points(scribbles_data, output_resolution=None):
@@ -86,23 +121,26 @@ def scribbles2points(scribbles_data, output_resolution=None):
     """
     scribbles = scribbles_data['scribbles']
 
-    paths, object_ids = [], []
+    nb_points = sum(len(l['path']) for s in scribbles for l in s)
+    paths = np.empty((nb_points, 3), dtype=np.float64)
+    object_ids = np.empty(nb_points, dtype=np.int32)
 
+    i = 0
     for frame, s in enumerate(scribbles):
         for l in s:
-            # p = l['path']
-            coordinates = [[frame] + point for point in l['path']]
-            paths += coordinates
-            object_ids += [l['object_id']] * len(l['path'])
-
-    paths = np.asarray(paths, dtype=np.float)
-    object_ids = np.asarray(object_ids, dtype=np.int)
+            n = len(l['path'])
+            if n == 0:
+                continue
+            paths[i:i + n, 0] = frame
+            paths[i:i + n, 1:] = l['path']
+            object_ids[i:i + n] = l['object_id']
+            i += n
 
     if output_resolution:
         h, w = output_resolution
-        img_size = np.asarray([1, h - 1, w - 1], dtype=np.float)
+        img_size = np.asarray([1, h - 1, w - 1], dtype=np.float64)
         paths *= img_size
-        paths = paths.astype(np.int)
+        paths = paths.astype(np.int32)
 
     return paths, object_ids
 
@@ -123,11 +161,12 @@ def fuse_scribbles(scribbles_a, scribbles_b):
     if len(scribbles_a['scribbles']) != len(scribbles_b['scribbles']):
         raise ValueError('Scribbles does not have the same number of frames')
 
+    # New lists for every frame so none of the given scribbles is modified
     scribbles = dict(scribbles_a)
-    nb_frames = len(scribbles['scribbles'])
-
-    for i in range(nb_frames):
-        scribbles['scribbles'][i] += scribbles_b['scribbles'][i]
+    scribbles['scribbles'] = [
+        a + b
+        for a, b in zip(scribbles_a['scribbles'], scribbles_b['scribbles'])
+    ]
 
     return scribbles
 
@@ -142,8 +181,8 @@ def is_empty(scribbles_data):
         bool: Whether the scribble is empty or not.
     """
     scribbles = scribbles_data['scribbles']
-    has_lines = [len(s) > 0 for s in scribbles]
-    return not any(has_lines)
+    # Every frame is a list of lines, so it is truthy only if non-empty
+    return not any(scribbles)
 
 
 def annotated_frames(scribbles_data):
@@ -26,15 +26,15 @@ class TestScribbles2Mask(unittest.TestCase):
 
         mask = scribbles2mask(scribbles_data, (480, 856))
         assert mask.shape == (2, 480, 856)
-        assert mask.dtype == np.int
+        assert mask.dtype == np.int16
 
         mask = scribbles2mask(scribbles_data, (100, 100))
         assert mask.shape == (2, 100, 100)
-        assert mask.dtype == np.int
+        assert mask.dtype == np.int16
 
         mask = scribbles2mask(scribbles_data, (1, 1))
         assert mask.shape == (2, 1, 1)
-        assert mask.dtype == np.int
+        assert mask.dtype == np.int16
 
         with pytest.raises(ValueError):
             mask = scribbles2mask(scribbles_data, (0, 100))
@@ -56,7 +56,7 @@ class TestScribbles2Mask(unittest.TestCase):
         }
         mask = scribbles2mask(scribbles_data, (480, 856))
         assert mask.shape == (2, 480, 856)
-        assert mask.dtype == np.int
+        assert mask.dtype == np.int16
 
     def test_mask_value(self):
         scribble_empty = {
@@ -86,7 +86,7 @@ class TestScribbles2Mask(unittest.TestCase):
         mask = scribbles2mask(
             scribbles_data, (100, 150), bresenham=False, default_value=0)
         assert mask.sum() == 2
-        assert mask.dtype == np.int
+        assert mask.dtype == np.int16
         assert mask.min() == 0 and mask.max() == 1
         assert mask[1, 0, 0] == 1
         assert mask[1, -1, 0] == 1
@@ -128,6 +128,67 @@ class TestScribbles2Mask(unittest.TestCase):
         assert np.all(mask[1, :, 0] == 1)
         assert np.all(mask[1, :, 1:] == 0)
 
+    def test_mask_multiple_paths(self):
+        scribbles_data = {
+            'scribbles': [[{
+                'path': [[0, 0], [0, 1]],
+                'object_id': 1
+            }, {
+                'path': [[1, 0], [1, 1]],
+                'object_id': 2
+            }, {
+                'path': [[0, 1], [1, 1]],
+                'object_id': 3
+            }]],
+            'sequence':
+            'test'
+        }
+        mask = scribbles2mask(scribbles_data, (100, 150), default_value=0)
+        assert np.all(mask[0, :-1, 0] == 1)
+        assert np.all(mask[0, :-1, -1] == 2)
+        assert np.all(mask[0, -1, :] == 3)
+        assert np.all(mask[0, :-1, 1:-1] == 0)
+
+    def test_mask_out_of_bounds(self):
+        scribbles_data = {
+            'scribbles': [[{
+                'path': [[0, 0], [0, 1.1]],
+                'object_id': 1
+            }]],
+            'sequence': 'test'
+        }
+        with pytest.raises(ValueError):
+            scribbles2mask(scribbles_data, (100, 150))
+
+    def test_only_annotated_frame(self):
+        scribbles_data = {
+            'scribbles': [[], [{
+                'path': [[0, 0], [0, 1]],
+                'object_id': 1
+            }], []],
+            'sequence': 'test'
+        }
+        masks = scribbles2mask(scribbles_data, (100, 150), default_value=0)
+        mask = scribbles2mask(
+            scribbles_data, (100, 150),
+            default_value=0,
+            only_annotated_frame=True)
+        assert mask.shape == (100, 150)
+        assert mask.dtype == np.int16
+        assert np.all(mask == masks[1])
+
+        scribbles_data['annotated_frame'] = 2
+        mask = scribbles2mask(
+            scribbles_data, (100, 150),
+            default_value=0,
+            only_annotated_frame=True)
+        assert np.all(mask == 0)
+
+        scribbles_data = {'scribbles': [[], []], 'sequence': 'test'}
+        with pytest.raises(ValueError):
+            scribbles2mask(
+                scribbles_data, (100, 150), only_annotated_frame=True)
+
 
 class TestScribbles2Points(unittest.TestCase):
 
@@ -145,9 +206,9 @@ class TestScribbles2Points(unittest.TestCase):
 
         X, Y = scribbles2points(scribbles_data)
         assert X.shape == (2, 3)
-        assert X.dtype == np.float
+        assert X.dtype == np.float64
         assert Y.shape == (2,)
-        assert Y.dtype == np.int
+        assert Y.dtype == np.int32
 
         assert np.all(X == np.asarray([[1, 0, 0], [1, 0, 0.1]]))
         assert np.all(Y == np.asarray([1, 1]))
@@ -166,15 +227,39 @@ class TestScribbles2Points(unittest.TestCase):
 
         X, Y = scribbles2points(scribbles_data, output_resolution=(100, 100))
         assert X.shape == (2, 3)
-        assert X.dtype == np.int
+        assert X.dtype == np.int32
         assert Y.shape == (2,)
-        assert Y.dtype == np.int
+        assert Y.dtype == np.int32
 
-        assert np.all(X == np.asarray([[1, 0, 0], [1, 0, 9]], dtype=np.int))
+        assert np.all(X == np.asarray([[1, 0, 0], [1, 0, 9]], dtype=np.int32))
         assert np.all(Y == np.asarray([1, 1]))
 
         X, Y = scribbles2points(scribbles_data, output_resolution=(101, 101))
-        assert np.all(X == np.asarray([[1, 0, 0], [1, 0, 10]], dtype=np.int))
+        assert np.all(X == np.asarray([[1, 0, 0], [1, 0, 10]], dtype=np.int32))
+
+    def test_multiple_frames(self):
+        scribbles_data = {
+            'scribbles': [[{
+                'path': [[0, 0.2]],
+                'object_id': 2
+            }], [], [{
+                'path': [[0, 0], [0, 0.1]],
+                'object_id': 1
+            }, {
+                'path': [],
+                'object_id': 3
+            }]],
+            'sequence':
+            'test'
+        }
+
+        X, Y = scribbles2points(scribbles_data)
+        assert np.all(X == np.asarray([[0, 0, .2], [2, 0, 0], [2, 0, .1]]))
+        assert np.all(Y == np.asarray([2, 1, 1]))
+
+        X, Y = scribbles2points({'scribbles': [[], []], 'sequence': 'test'})
+        assert X.shape == (0, 3)
+        assert Y.shape == (0,)
 
 
 class TestFuseScribbles(unittest.TestCase):
@@ -247,6 +332,26 @@ class TestFuseScribbles(unittest.TestCase):
 
         assert scribble_result == fuse_scribbles(scribble, scribble)
 
+    def test_inputs_not_modified(self):
+        scribble_1 = {
+            'scribbles': [[], [{
+                'path': [[0, 0], [0, 0.1]],
+                'object_id': 1
+            }]],
+            'sequence': 'test',
+        }
+        scribble_2 = {
+            'scribbles': [[{
+                'path': [[0, 0], [0, 0.1]],
+                'object_id': 2
+            }], []],
+            'sequence': 'test',
+        }
+        fused = fuse_scribbles(scribble_1, scribble_2)
+        assert [len(s) for s in fused['scribbles']] == [1, 1]
+        assert [len(s) for s in scribble_1['scribbles']] == [0, 1]
+        assert [len(s) for s in scribble_2['scribbles']] == [1, 0]
+
     def test_wrong_sequence(self):
         scribble_1 = {
             'scribbles': [[], [{
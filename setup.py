@@ -34,5 +34,6 @@ setup(
         'scipy>=1.0.0',
         'six>=1.10.0',
     ],
+    extras_require={'numba': ['numba>=0.45']},
     # test_require=['mock;python_version<"3.0"'],
     ext_modules=cythonize(ext_modules))